@@ -3,9 +3,11 @@
 Translation center script package.
 """
 
+import logging
+import os
 import sys
 from .config import load_repos_config, validate_config
-from .pull_sources import pull_sources
+from .pull_sources import PULL_MODES, pull_sources
 from .pull_translations import pull_translations
 from .push_translations import push_translations
 
@@ -14,6 +16,17 @@ def main() -> None:
     """
     Main entry point for the script package.
     """
+    # Progress is reported through logging, set LOG_LEVEL=DEBUG to include per-file details
+    log_level = (os.environ.get("LOG_LEVEL") or "INFO").upper()
+    if log_level not in logging.getLevelNamesMapping():
+        print(f"Unknown LOG_LEVEL: {log_level}, using INFO")
+        log_level = "INFO"
+
+    logging.basicConfig(
+        level=log_level,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+
     # Load configuration
     config = load_repos_config()
     validate_config(config)
@@ -22,7 +35,16 @@ def main() -> None:
     if len(sys.argv) > 1:
         command = sys.argv[1]
         if command == "pull_sources":
-            pull_sources(config)
+            # Shallow clone by default, --mode=raw downloads files one by one
+            mode = "clone"
+            for arg in sys.argv[2:]:
+                if arg.startswith("--mode="):
+                    mode = arg.removeprefix("--mode=")
+            if mode in PULL_MODES:
+                pull_sources(config, mode)
+            else:
+                print(f"Unknown mode: {mode}")
+                print(f"Available modes: {', '.join(PULL_MODES)}")
         elif command == "pull_translations":
             pull_translations(config)
         elif command == "push_translations":
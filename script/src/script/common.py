@@ -3,9 +3,12 @@
 Common utility functions.
 """
 
+from functools import lru_cache
+import logging
 from pathlib import Path
 import subprocess
 
+logger = logging.getLogger(__name__)
 
 # Language code mapping for standardization
 LANGUAGE_CODE_MAPPING = {
@@ -26,36 +29,68 @@ def get_mapped_language_code(
     return language_code
 
 
-def git_commit_changes(message: str) -> None:
+def git_commit_files(message: str, paths: list[str], cwd: Path) -> None:
+    """
+    Stage and commit the given files.
+
+    Args:
+        message: Commit message
+        paths: Paths of the files to commit, relative to cwd
+        cwd: Root directory of the git repository
+
+    Raises:
+        subprocess.CalledProcessError: If a git command fails
+    """
+    # Committing tracked files by pathspec stages them too, saving a separate git add
+    result = subprocess.run(
+        ["git", "commit", "-m", message, "--", *paths],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode == 0:
+        return
+
+    # Untracked files don't match the pathspec until they are added
+    subprocess.run(
+        ["git", "add", "--", *paths], check=True, cwd=cwd, capture_output=True, text=True
+    )
+    subprocess.run(
+        ["git", "commit", "-m", message, "--", *paths],
+        check=True,
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+
+
+def git_commit_changes(message: str, paths: list[str]) -> None:
     """
     Commit changes to git repository.
 
     Args:
         message: Commit message
+        paths: Paths of the changed files relative to the project root
     """
 
+    root_dir = get_project_root_dir()
+
     try:
-        # Add all changes
-        subprocess.run(["git", "add", "."], check=True, cwd=get_project_root_dir())
-        print("Added changes to git")
-
-        # Commit changes
-        subprocess.run(
-            ["git", "commit", "-m", message],
-            check=True,
-            cwd=get_project_root_dir(),
-        )
-        print(f"Committed changes: {message}")
+        git_commit_files(message, paths, root_dir)
+        logger.info(f"Committed changes: {message}")
 
         # Push changes
-        subprocess.run(["git", "push"], check=True, cwd=get_project_root_dir())
-        print("Pushed changes to remote")
+        subprocess.run(["git", "push"], check=True, cwd=root_dir)
+        logger.info("Pushed changes to remote")
 
     except subprocess.CalledProcessError as e:
-        print(f"Git operation failed: {e}")
+        logger.error(f"Git operation failed: {e}")
+        if e.stderr:
+            logger.error(f"  stderr: {e.stderr.strip()}")
         raise
 
 
+@lru_cache(maxsize=1)
 def get_project_root_dir() -> Path:
     """
     Get the path to project's root directory.
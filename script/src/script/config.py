@@ -3,12 +3,18 @@ Configuration management for the translation center script.
 This module handles loading and validating configuration from config files.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import TypedDict, cast
 from ruamel.yaml import YAML
 from .common import get_project_root_dir
 
 
+# Keys every repository and file configuration must define
+REQUIRED_REPO_KEYS = ("owner", "repo", "branch", "folder", "files")
+REQUIRED_FILE_KEYS = ("source", "name", "target")
+
+
 class FileConfig(TypedDict):
     """Configuration for a translation file."""
 
@@ -34,6 +40,7 @@ class Config(TypedDict):
     repos: list[RepoConfig]
 
 
+@lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """
     Get the path to the configuration directory.
@@ -60,9 +67,9 @@ def load_repos_config() -> Config:
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    yaml_loader = YAML()
-    yaml_loader.preserve_quotes = True
-    yaml_loader.width = 4096
+    # Comments and quotes are irrelevant here, so use the safe loader,
+    # which is backed by libyaml when ruamel.yaml.clib is installed
+    yaml_loader = YAML(typ="safe")
 
     with open(config_path, "r", encoding="utf-8") as file:
         data = yaml_loader.load(file)
@@ -88,12 +95,18 @@ def validate_config(config: Config) -> None:
         raise ValueError("'repos' must be a list")
 
     for repo in config["repos"]:
-        required_keys = ["owner", "repo", "branch", "folder", "files"]
-        for key in required_keys:
+        if not isinstance(repo, dict):
+            raise ValueError("Repository configuration must be a mapping")
+
+        for key in REQUIRED_REPO_KEYS:
             if key not in repo:
                 raise ValueError(
                     f"Repository configuration missing required key: {key}"
                 )
+            if key != "files" and not isinstance(repo[key], str):
+                raise ValueError(
+                    f"'{key}' in repository {repo.get('repo')} must be a string"
+                )
 
         if not isinstance(repo["files"], list):
             raise ValueError(f"'files' in repository {repo['repo']} must be a list")
@@ -105,9 +118,15 @@ def validate_config(config: Config) -> None:
                 )
 
         for file in repo["files"]:
-            file_required_keys = ["source", "name", "target"]
-            for key in file_required_keys:
+            if not isinstance(file, dict):
+                raise ValueError(f"File configuration in {repo['repo']} must be a mapping")
+
+            for key in REQUIRED_FILE_KEYS:
                 if key not in file:
                     raise ValueError(
                         f"File configuration in {repo['repo']} missing required key: {key}"
                     )
+                if not isinstance(file[key], str):
+                    raise ValueError(
+                        f"'{key}' of a file in repository {repo['repo']} must be a string"
+                    )
@@ -3,19 +3,87 @@
 Common utilities for pulling and processing translation files.
 """
 
-from io import StringIO
+from concurrent.futures import Future
+from functools import lru_cache
+import hashlib
+from io import BytesIO
+import json
+import logging
+import os
+import pickle
+import random
 import re
-import ssl
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any, List
-from urllib.request import urlopen
-from urllib.error import URLError, HTTPError
+from typing import Callable, Dict, Any, Hashable, TypeVar
+import requests
+from requests.adapters import HTTPAdapter
 from ruamel.yaml import YAML
 from ruamel.yaml.scalarstring import LiteralScalarString
+from urllib3.util import Retry
 
-from .config import Config, RepoConfig, FileConfig
+from .common import get_project_root_dir
 
+logger = logging.getLogger(__name__)
 
+# Maximum number of concurrent downloads
+MAX_WORKERS = 8
+
+# Hosts downloads are made from, each gets its own connection pool
+GITHUB_HOSTS = ("raw.githubusercontent.com", "api.github.com")
+
+# Timeout in seconds for a single HTTP request
+REQUEST_TIMEOUT = 30
+
+# Pause once fewer API requests than this remain in the rate limit window
+RATE_LIMIT_THRESHOLD = 5
+
+# Longest time in seconds to wait for the rate limit to reset
+MAX_RATE_LIMIT_WAIT = 300
+
+# Seconds to wait after a rate limit rejection that doesn't say how long (GitHub asks for a minute)
+SECONDARY_RATE_LIMIT_WAIT = 60
+
+# Bump when process_yaml_data changes so stale parse results are ignored
+YAML_CACHE_VERSION = 1
+
+# Parse results unused for this many seconds are removed from the cache
+YAML_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+# Whole lines (including the line break) with comments marking them as not to be translated
+SKIP_LINE_PATTERN = re.compile(
+    r"^.*#.*(?:do not|don't) translate.*(?:\n|\Z)", re.IGNORECASE | re.MULTILINE
+)
+
+T = TypeVar("T")
+
+# Downloads made during this run, shared by identical requests
+_downloads: dict[Hashable, Future[Any]] = {}
+_downloads_lock = threading.Lock()
+
+# Directories already created during this run
+_ensured_dirs: set[Path] = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+def ensure_dir(dir_path: Path) -> None:
+    """
+    Create a directory if it doesn't exist, at most once per run.
+
+    Args:
+        dir_path: The directory to create
+    """
+    if dir_path in _ensured_dirs:
+        return
+
+    with _ensured_dirs_lock:
+        if dir_path not in _ensured_dirs:
+            dir_path.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(dir_path)
+
+
+@lru_cache(maxsize=1)
 def get_translations_dir() -> Path:
     """
     Get the path to the translations directory.
@@ -23,8 +91,151 @@ def get_translations_dir() -> Path:
     Returns:
         Path: The path to the translations directory.
     """
-    script_dir = Path(__file__).resolve().parent.parent.parent.parent
-    return script_dir / "translations"
+    return get_project_root_dir() / "translations"
+
+
+@lru_cache(maxsize=1)
+def get_cache_dir() -> Path:
+    """
+    Get the path to the local download cache directory.
+
+    Returns:
+        Path: The path to the cache directory.
+    """
+    return get_project_root_dir() / "script" / ".cache"
+
+
+@lru_cache(maxsize=1)
+def get_yaml_cache_dir() -> Path:
+    """
+    Get the path to the cache directory of parsed YAML content.
+
+    Returns:
+        Path: The path to the parse cache directory.
+    """
+    return get_cache_dir() / "yaml"
+
+
+def prune_yaml_cache() -> None:
+    """
+    Remove parse results that haven't been used for YAML_CACHE_MAX_AGE,
+    so the cache doesn't keep every version of every file forever.
+    """
+    cache_dir = get_yaml_cache_dir()
+    if not cache_dir.exists():
+        return
+
+    expires = time.time() - YAML_CACHE_MAX_AGE
+    for cache_path in cache_dir.iterdir():
+        try:
+            if cache_path.stat().st_mtime < expires:
+                cache_path.unlink()
+        except OSError as e:
+            logger.warning(f"Failed to prune parse cache entry {cache_path.name}: {e}")
+
+
+def get_pull_index_path() -> Path:
+    """
+    Get the path to the index of previously downloaded files.
+
+    Returns:
+        Path: The path to the index file.
+    """
+    return get_cache_dir() / "pull-index.json"
+
+
+def load_pull_index() -> Dict[str, Dict[str, Any]]:
+    """
+    Load the ETags and hashes recorded for previously downloaded files.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Mapping of URL to its ETag, the hash of the saved file and the processing version
+    """
+    index_path = get_pull_index_path()
+    if not index_path.exists():
+        return {}
+
+    try:
+        return json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Failed to load pull index: {e}")
+        return {}
+
+
+def save_pull_index(index: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Save the ETags and hashes of downloaded files for the next run.
+    The whole index is written once, replacing the previous file atomically.
+
+    Args:
+        index: Mapping of URL to its ETag, the hash of the saved file and the processing version
+    """
+    index_path = get_pull_index_path()
+    ensure_dir(index_path.parent)
+    write_file_atomic(index_path, json.dumps(index, separators=(",", ":")).encode("utf-8"))
+
+
+def get_file_hash(file_path: Path) -> str:
+    """
+    Calculate the SHA-256 hash of a file.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        str: Hex digest of the file content
+    """
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def get_cached_etag(
+    pull_index: Dict[str, Dict[str, Any]], url: str, target_path: Path
+) -> str | None:
+    """
+    Get the ETag to send when downloading a file again.
+    A cached ETag is only trusted if the local file is the one saved from it
+    by the current version of the processing.
+
+    Args:
+        pull_index: ETags and hashes of previously downloaded files
+        url: URL of the file
+        target_path: Path where the processed file is saved
+
+    Returns:
+        str | None: The cached ETag, or None to download unconditionally
+    """
+    cached = pull_index.get(url)
+    if (
+        cached
+        # Files saved by other processing have to be processed again
+        and cached.get("version") == YAML_CACHE_VERSION
+        and target_path.exists()
+        and get_file_hash(target_path) == cached["sha256"]
+    ):
+        return cached["etag"]
+    return None
+
+
+def update_pull_index(
+    pull_index: Dict[str, Dict[str, Any]], url: str, etag: str | None, target_path: Path
+) -> None:
+    """
+    Record the ETag of a downloaded file with the hash of the file saved from it
+    and the YAML_CACHE_VERSION of the processing that produced it.
+
+    Args:
+        pull_index: ETags and hashes of previously downloaded files, updated in place
+        url: URL of the file
+        etag: ETag returned with the download
+        target_path: Path where the processed file is saved
+    """
+    # Nothing is saved for files without translatable strings
+    if etag and target_path.exists():
+        pull_index[url] = {
+            "etag": etag,
+            "sha256": get_file_hash(target_path),
+            "version": YAML_CACHE_VERSION,
+        }
 
 
 def get_github_raw_url(owner: str, repo: str, branch: str, file_path: str) -> str:
@@ -43,53 +254,212 @@ def get_github_raw_url(owner: str, repo: str, branch: str, file_path: str) -> st
     return f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{file_path}"
 
 
-def download_file_content(url: str) -> str:
+class SessionRetry(Retry):
+    """
+    Retry policy of the shared session.
+    urllib3 only honors Retry-After on 503 here; rate limit rejections (429)
+    are left to wait_for_rate_limit, which applies MAX_RATE_LIMIT_WAIT.
+    """
+
+    RETRY_AFTER_STATUS_CODES = frozenset({503})
+
+
+# Resends rate limited requests once, without another round of urllib3 retries
+_resend_adapter = HTTPAdapter(
+    pool_connections=len(GITHUB_HOSTS), pool_maxsize=MAX_WORKERS, max_retries=0
+)
+
+
+def wait_for_rate_limit(
+    response: requests.Response, *args: Any, **kwargs: Any
+) -> requests.Response | None:
+    """
+    Sleep until the GitHub rate limit resets if it is almost exhausted.
+    A request rejected by the rate limit (403/429) is sent again once after the wait,
+    unless the limit resets later than MAX_RATE_LIMIT_WAIT.
+
+    Args:
+        response: The response to inspect
+        **kwargs: Options the request was sent with
+
+    Returns:
+        requests.Response | None: The response of the resent request, or None to keep the original
+    """
+    status = response.status_code
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    reset = response.headers.get("X-RateLimit-Reset")
+    retry_after = response.headers.get("Retry-After", "")
+    rate_limited = status == 429 or (
+        status == 403 and (remaining == "0" or retry_after.isdigit())
+    )
+
+    if rate_limited and retry_after.isdigit():
+        # Secondary rate limits say how long to wait instead of when they reset
+        wait = float(retry_after)
+    elif remaining is not None and reset is not None and int(remaining) < RATE_LIMIT_THRESHOLD:
+        wait = max(0.0, int(reset) - time.time())
+    elif rate_limited:
+        wait = SECONDARY_RATE_LIMIT_WAIT
+    else:
+        return None
+
+    if wait > MAX_RATE_LIMIT_WAIT:
+        if rate_limited:
+            # Resending before the reset would only be rejected again
+            logger.error(
+                f"  Rate limit resets in {wait:.0f}s, longer than {MAX_RATE_LIMIT_WAIT}s: {response.url}"
+            )
+            return None
+        wait = MAX_RATE_LIMIT_WAIT
+
+    # Add jitter so concurrent workers don't resume at the same moment
+    wait += random.uniform(0, 1)
+    if rate_limited:
+        logger.warning(f"  Rate limited, waiting {wait:.0f}s: {response.url}")
+    else:
+        logger.warning(f"  Rate limit nearly exhausted ({remaining} left), waiting {wait:.0f}s")
+    time.sleep(wait)
+
+    if rate_limited:
+        logger.info(f"  Retrying after rate limit reset: {response.url}")
+        # Release the rejected response's connection before sending again.
+        # The resend adapter doesn't run this hook or urllib3 retries again.
+        response.close()
+        return _resend_adapter.send(response.request, **kwargs)
+
+    return None
+
+
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session that keeps connections alive between requests.
+    Requests are authenticated with GITHUB_TOKEN when it is set, which raises
+    the GitHub rate limit from 60 to 5000 requests per hour.
+
+    Returns:
+        requests.Session: Configured HTTP session
+    """
+    retry = SessionRetry(
+        total=6,
+        backoff_factor=1.0,
+        backoff_jitter=1.0,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        retry_after_max=MAX_RATE_LIMIT_WAIT,
+        # Return the last response once retries run out, so callers see its status
+        raise_on_status=False,
+    )
+    # Keep a pool per host so alternating API and raw requests don't evict each other,
+    # with a connection for every worker thread
+    adapter = HTTPAdapter(
+        pool_connections=len(GITHUB_HOSTS), pool_maxsize=MAX_WORKERS, max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.hooks["response"].append(wait_for_rate_limit)
+
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        session.headers["Authorization"] = f"Bearer {token}"
+
+    return session
+
+
+# Shared by all downloads so connections and TLS sessions are reused
+_session = create_session()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the HTTP session shared by all GitHub requests.
+
+    Returns:
+        requests.Session: The shared HTTP session
+    """
+    return _session
+
+
+def fetch_once(key: Hashable, fetch: Callable[[], T]) -> T:
     """
-    Download file content from URL.
+    Run a download at most once per run, sharing its result with identical requests.
+    Concurrent callers with the same key wait for the first one instead of downloading again.
+
+    Args:
+        key: Identifies the download
+        fetch: Performs the download
+
+    Returns:
+        T: The result of the download
+    """
+    with _downloads_lock:
+        future = _downloads.get(key)
+        is_owner = future is None
+        if future is None:
+            future = Future()
+            _downloads[key] = future
+
+    if is_owner:
+        try:
+            future.set_result(fetch())
+        except Exception as e:
+            # Let later callers try again instead of reusing the failure
+            with _downloads_lock:
+                del _downloads[key]
+            future.set_exception(e)
+
+    return future.result()
+
+
+def download_json_content(url: str) -> Any:
+    """
+    Download and parse JSON content from URL.
 
     Args:
         url: The URL to download from
 
     Returns:
-        str: The file content
+        Any: Parsed JSON data
 
     Raises:
-        URLError: If the download fails
+        requests.RequestException: If the download fails
     """
-    try:
-        # Create SSL context that doesn't verify certificates
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
 
-        with urlopen(url, context=ssl_context) as response:
-            return response.read().decode("utf-8")
-    except (URLError, HTTPError) as e:
-        raise URLError(f"Failed to download {url}: {e}")
+    def fetch() -> Any:
+        response = _session.get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+
+    return fetch_once(("json", url), fetch)
 
 
-def should_skip_line(line: str) -> bool:
+def download_modified_content(url: str, etag: str | None) -> tuple[str | None, str | None]:
     """
-    Check if a line should be skipped based on comments.
+    Download file content from URL unless it matches the given ETag.
 
     Args:
-        line: The line to check
+        url: The URL to download from
+        etag: ETag of the previously downloaded content, if any
 
     Returns:
-        bool: True if the line should be skipped
+        tuple[str | None, str | None]: The file content, or None if not modified, and the current ETag
+
+    Raises:
+        requests.RequestException: If the download fails
     """
-    skip_patterns = [
-        r"#.*DO NOT translate",
-        r"#.*do not translate",
-        r"#.*Don't translate",
-        r"#.*don't translate",
-    ]
 
-    for pattern in skip_patterns:
-        if re.search(pattern, line, re.IGNORECASE):
-            return True
+    def fetch() -> tuple[str | None, str | None]:
+        headers = {"If-None-Match": etag} if etag else None
+        response = _session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
 
-    return False
+        if response.status_code == 304:
+            return None, etag
+
+        response.raise_for_status()
+        return response.content.decode("utf-8"), response.headers.get("ETag")
+
+    return fetch_once(("modified", url, etag), fetch)
 
 
 def process_yaml_content(content: str) -> Dict[str, Any]:
@@ -102,15 +472,23 @@ def process_yaml_content(content: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Processed YAML data
     """
-    # Filter out lines with should skip comments
-    lines = content.split("\n")
-    filtered_lines = []
-
-    for line in lines:
-        if not should_skip_line(line):
-            filtered_lines.append(line)
-
-    filtered_content = "\n".join(filtered_lines)
+    # Filter out lines with should skip comments in one pass over the content
+    filtered_content = SKIP_LINE_PATTERN.sub("", content)
+
+    # Reuse the result of a previous run if the same content was already parsed
+    content_hash = hashlib.sha256(
+        f"{YAML_CACHE_VERSION}\n{filtered_content}".encode("utf-8")
+    ).hexdigest()
+    cache_path = get_yaml_cache_dir() / f"{content_hash}.pkl"
+    if cache_path.exists():
+        try:
+            processed_data = pickle.loads(cache_path.read_bytes())
+            # Mark the entry as used so prune_yaml_cache keeps it
+            os.utime(cache_path)
+            return processed_data
+        except Exception:
+            # Corrupted cache entry, parse again
+            pass
 
     # Parse the filtered YAML with order preservation
     try:
@@ -118,13 +496,23 @@ def process_yaml_content(content: str) -> Dict[str, Any]:
         yaml_loader.preserve_quotes = True
         yaml_loader.width = 4096
 
-        data = yaml_loader.load(StringIO(filtered_content))
+        data = yaml_loader.load(filtered_content)
         processed_data = process_yaml_data(data)
-        return processed_data if processed_data else {}
     except Exception as e:
-        print(f"Warning: Failed to parse YAML content: {e}")
+        logger.warning(f"Failed to parse YAML content: {e}")
+        return {}
+
+    if not processed_data:
         return {}
 
+    try:
+        ensure_dir(cache_path.parent)
+        write_file_atomic(cache_path, pickle.dumps(processed_data))
+    except OSError as e:
+        logger.warning(f"Failed to cache parsed YAML: {e}")
+
+    return processed_data
+
 
 def process_yaml_data(data: Any) -> Any:
     """
@@ -145,32 +533,26 @@ def process_yaml_data(data: Any) -> Any:
                 result[key] = processed_value
         return result if result else None
     elif isinstance(data, list):
+        # Process each item in the list and keep only strings, in a single pass
+        processed_items = []
+        all_strings = True
+        for item in data:
+            if isinstance(item, str):
+                processed_items.append(item)
+            elif isinstance(item, (dict, list)):
+                processed_item = process_yaml_data(item)
+                if processed_item is not None:
+                    processed_items.append(processed_item)
+                    all_strings = all_strings and isinstance(processed_item, str)
+
         # Skip empty lists - don't import empty list fields
-        if not data:
+        if not processed_items:
             return None
 
-        # Convert list to multiline string if all elements are strings
-        if all(isinstance(item, str) for item in data):
-            # Always use multiline format for string lists, even with single item
-            multiline_content = "\n".join(data)
-            return LiteralScalarString(multiline_content)
-        else:
-            # Process each item in the list and keep only strings
-            processed_items = []
-            for item in data:
-                if isinstance(item, str):
-                    processed_items.append(item)
-                elif isinstance(item, (dict, list)):
-                    processed_item = process_yaml_data(item)
-                    if processed_item is not None:
-                        processed_items.append(processed_item)
-            # Convert to multiline string if we have string items
-            if processed_items and all(
-                isinstance(item, str) for item in processed_items
-            ):
-                multiline_content = "\n".join(processed_items)
-                return LiteralScalarString(multiline_content)
-            return processed_items if processed_items else None
+        # Always use multiline format for string lists, even with single item
+        if all_strings:
+            return LiteralScalarString("\n".join(processed_items))
+        return processed_items
     elif isinstance(data, str):
         return data
     else:
@@ -202,6 +584,25 @@ def create_yaml(preserve_quotes: bool = False) -> YAML:
     return yaml_processor
 
 
+def write_file_atomic(file_path: Path, content: bytes) -> None:
+    """
+    Write a file so readers never observe it partially written.
+
+    Args:
+        file_path: Path of the file to write
+        content: The content to write
+    """
+    # Each thread writes its own temporary file, so concurrent writers of the same file can't clash
+    temp_path = file_path.with_name(f".{file_path.name}.{threading.get_ident()}.tmp")
+    try:
+        temp_path.write_bytes(content)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        # Don't leave the temporary file behind in the tracked translations directory
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
 def save_yaml_file(
     data: Dict[str, Any], target_path: Path, preserve_quotes: bool = False
 ) -> bool:
@@ -217,29 +618,30 @@ def save_yaml_file(
         bool: Whether the file is updated
     """
     # Create directory if it doesn't exist
-    target_path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir(target_path.parent)
+
+    # Serialize once and compare bytes instead of parsing the existing file
+    yaml_dumper = create_yaml(preserve_quotes)
+    buffer = BytesIO()
+    yaml_dumper.dump(data, buffer)
+    new_content = buffer.getvalue()
 
     # Check if file exists and compare content
     file_changed = True
-    if target_path.exists():
-        try:
-            yaml_loader = YAML()
-            with open(target_path, "r", encoding="utf-8") as f:
-                existing_data = yaml_loader.load(f)
-            file_changed = existing_data != data
-        except (Exception, IOError):
-            # If we can't read the existing file, assume it changed
-            file_changed = True
+    try:
+        # A different size means different content, no need to read the file
+        if target_path.stat().st_size == len(new_content):
+            file_changed = target_path.read_bytes() != new_content
+    except OSError:
+        # If the file is missing or can't be read, assume it changed
+        file_changed = True
 
     if file_changed:
         # Save the processed data
-        yaml_dumper = create_yaml(preserve_quotes)
-
-        with open(target_path, "w", encoding="utf-8") as f:
-            yaml_dumper.dump(data, f)
+        write_file_atomic(target_path, new_content)
 
-        print(f"  Saved: {target_path}")
+        logger.info(f"  Saved: {target_path}")
         return True
     else:
-        print(f"  No changes: {target_path}")
+        logger.debug(f"  No changes: {target_path}")
         return False
@@ -3,22 +3,63 @@
 Pull source files from GitHub repositories and process them for translation.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import logging
 from pathlib import Path
-from typing import List
+import subprocess
+import tempfile
+from typing import Any, Dict, List, Tuple
 
 from .config import Config, RepoConfig, FileConfig
 from .common import git_commit_changes
 from .pull_common import (
+    MAX_WORKERS,
     get_translations_dir,
     get_github_raw_url,
-    download_file_content,
+    get_cached_etag,
+    update_pull_index,
+    download_modified_content,
+    load_pull_index,
+    save_pull_index,
+    prune_yaml_cache,
     process_yaml_content,
     save_yaml_file,
 )
 
+logger = logging.getLogger(__name__)
+
+# Available ways of fetching source files
+PULL_MODES = ("clone", "raw")
+
+
+def save_source_file(content: str, file_config: FileConfig, target_path: Path) -> bool:
+    """
+    Process downloaded source content and save it as a translation source file.
+
+    Args:
+        content: Raw YAML content of the source file
+        file_config: File configuration
+        target_path: Path where to save the file
+
+    Returns:
+        bool: Whether the file is updated
+    """
+    # Process YAML content
+    data = process_yaml_content(content)
+
+    if not data:
+        logger.warning(f"  No translatable strings found in {file_config['source']}")
+        return False
+
+    # Save processed file
+    return save_yaml_file(data, target_path, preserve_quotes=False)
+
 
 def pull_file(
-    repo_config: RepoConfig, file_config: FileConfig, translations_dir: Path
+    repo_config: RepoConfig,
+    file_config: FileConfig,
+    translations_dir: Path,
+    pull_index: Dict[str, Dict[str, Any]],
 ) -> bool:
     """
     Pull and process a single file from a repository.
@@ -27,6 +68,7 @@ def pull_file(
         repo_config: Repository configuration
         file_config: File configuration
         translations_dir: Base translations directory
+        pull_index: ETags and hashes of previously downloaded files, updated in place
 
     Returns:
         bool: Whether the file is updated
@@ -39,35 +81,124 @@ def pull_file(
         file_config["source"],
     )
 
-    print(f"  Downloading: {url}")
+    logger.debug(f"  Downloading: {url}")
 
-    try:
-        # Download file content
-        content = download_file_content(url)
+    # Determine target path
+    target_path = translations_dir / repo_config["folder"] / file_config["name"]
 
-        # Process YAML content
-        data = process_yaml_content(content)
+    try:
+        # Download file content, unless it is unchanged since the last run
+        content, new_etag = download_modified_content(
+            url, get_cached_etag(pull_index, url, target_path)
+        )
 
-        if not data:
-            print(
-                f"  Warning: No translatable strings found in {file_config['source']}"
-            )
+        if content is None:
+            logger.debug(f"  Not modified: {target_path}")
             return False
 
-        # Determine target path
-        target_path = translations_dir / repo_config["folder"] / file_config["name"]
+        updated = save_source_file(content, file_config, target_path)
+        update_pull_index(pull_index, url, new_etag, target_path)
+        return updated
+
+    except Exception as e:
+        logger.error(f"  Error processing {file_config['source']}: {e}")
+        return False
+
+
+def clone_sources(repo_config: RepoConfig, clone_dir: Path) -> None:
+    """
+    Shallow clone a repository, checking out only the configured source files.
+
+    Args:
+        repo_config: Repository configuration
+        clone_dir: Directory to clone into
+    """
+    clone_url = f"https://github.com/{repo_config['owner']}/{repo_config['repo']}.git"
+    logger.debug(f"  Cloning: {clone_url}")
+
+    subprocess.run(
+        [
+            "git",
+            "clone",
+            "--depth=1",
+            "--filter=blob:none",
+            "--sparse",
+            "--branch",
+            repo_config["branch"],
+            clone_url,
+            str(clone_dir),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
 
-        # Save processed file
-        return save_yaml_file(data, target_path, preserve_quotes=False)
+    # Only the blobs of the source files are fetched
+    subprocess.run(
+        [
+            "git",
+            "-C",
+            str(clone_dir),
+            "sparse-checkout",
+            "set",
+            "--no-cone",
+            *[f"/{file_config['source']}" for file_config in repo_config["files"]],
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
 
+
+def pull_cloned_file(
+    repo_config: RepoConfig,
+    file_config: FileConfig,
+    translations_dir: Path,
+    clone_dir: Path,
+) -> bool:
+    """
+    Process a single source file from a cloned repository.
+
+    Args:
+        repo_config: Repository configuration
+        file_config: File configuration
+        translations_dir: Base translations directory
+        clone_dir: Directory of the cloned repository
+
+    Returns:
+        bool: Whether the file is updated
+    """
+    target_path = translations_dir / repo_config["folder"] / file_config["name"]
+
+    try:
+        content = (clone_dir / file_config["source"]).read_text(encoding="utf-8")
+        return save_source_file(content, file_config, target_path)
     except Exception as e:
-        print(f"  Error processing {file_config['source']}: {e}")
+        logger.error(f"  Error processing {file_config['source']}: {e}")
         return False
 
 
+def get_relative_path(
+    repo_config: RepoConfig, file_config: FileConfig, translations_dir: Path
+) -> str:
+    """
+    Get the path of a pulled file relative to the project root.
+
+    Args:
+        repo_config: Repository configuration
+        file_config: File configuration
+        translations_dir: Base translations directory
+
+    Returns:
+        str: The relative file path
+    """
+    # The project root is the parent of translations_dir, so no path walk is needed
+    return str(Path(translations_dir.name) / repo_config["folder"] / file_config["name"])
+
+
 def pull_repo(repo_config: RepoConfig, translations_dir: Path) -> List[str]:
     """
-    Pull source files from a repository.
+    Pull source files from a repository with a single shallow clone.
 
     Args:
         repo_config: Repository configuration
@@ -76,47 +207,89 @@ def pull_repo(repo_config: RepoConfig, translations_dir: Path) -> List[str]:
     Returns:
         List[str]: List of updated file paths
     """
-    print(
+    logger.info(
         f"Processing repository: {repo_config['owner']}/{repo_config['repo']}:{repo_config['branch']}"
     )
 
     updated_files = []
 
-    for file_config in repo_config["files"]:
-        if pull_file(repo_config, file_config, translations_dir):
-            target_path = translations_dir / repo_config["folder"] / file_config["name"]
-            updated_files.append(str(target_path.relative_to(translations_dir.parent)))
+    with tempfile.TemporaryDirectory(prefix=f"pull_{repo_config['repo']}_") as temp_dir:
+        clone_dir = Path(temp_dir)
+        clone_sources(repo_config, clone_dir)
+
+        for file_config in repo_config["files"]:
+            if pull_cloned_file(repo_config, file_config, translations_dir, clone_dir):
+                updated_files.append(
+                    get_relative_path(repo_config, file_config, translations_dir)
+                )
 
     return updated_files
 
 
-def pull_sources(config: Config) -> None:
+def pull_sources(config: Config, mode: str = "clone") -> None:
     """
     Pull source translation files from all configured repositories.
 
     Args:
         config: The configuration containing all repositories
+        mode: "clone" to fetch each repository with one shallow clone, "raw" to download files one by one
     """
     translations_dir = get_translations_dir()
+    pull_index = load_pull_index()
     all_updated_files = []
 
-    print(f"Pulling source translation files to: {translations_dir}")
+    logger.info(f"Pulling source translation files to: {translations_dir}")
+
+    # All repositories share one pool, so a slow repository doesn't hold up the rest.
+    # Clone mode runs one task per repository, raw mode one task per file.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures: Dict[Future[Any], Tuple[RepoConfig, FileConfig | None]] = {}
 
-    for repo_config in config["repos"]:
-        try:
-            updated_files = pull_repo(repo_config, translations_dir)
-            all_updated_files.extend(updated_files)
-        except Exception as e:
-            print(
-                f"Error processing repository {repo_config['owner']}/{repo_config['repo']}: {e}"
+        for repo_config in config["repos"]:
+            if mode == "clone":
+                future = executor.submit(pull_repo, repo_config, translations_dir)
+                futures[future] = (repo_config, None)
+                continue
+
+            logger.info(
+                f"Processing repository: {repo_config['owner']}/{repo_config['repo']}:{repo_config['branch']}"
             )
-            continue
+            for file_config in repo_config["files"]:
+                future = executor.submit(
+                    pull_file, repo_config, file_config, translations_dir, pull_index
+                )
+                futures[future] = (repo_config, file_config)
+
+        for future in as_completed(futures):
+            repo_config, file_config = futures[future]
+            try:
+                if file_config is None:
+                    all_updated_files.extend(future.result())
+                elif future.result():
+                    all_updated_files.append(
+                        get_relative_path(repo_config, file_config, translations_dir)
+                    )
+            except subprocess.CalledProcessError as e:
+                # Clone failures carry the actual git error in the captured output
+                logger.error(
+                    f"Git operation failed for {repo_config['owner']}/{repo_config['repo']}: {e}"
+                )
+                if e.stderr:
+                    logger.error(f"  stderr: {e.stderr.strip()}")
+            except Exception as e:
+                logger.error(
+                    f"Error processing repository {repo_config['owner']}/{repo_config['repo']}: {e}"
+                )
 
     # Commit all changes
     if all_updated_files:
-        git_commit_changes("chore: update source translation files")
+        git_commit_changes("chore: update source translation files", all_updated_files)
     else:
-        print("No files were updated. Skipping git commit.")
+        logger.info("No files were updated. Skipping git commit.")
+
+    # Only remember ETags once the files they describe are committed
+    save_pull_index(pull_index)
+    prune_yaml_cache()
 
-    print(f"\nCompleted pulling {len(config['repos'])} repositories.")
-    print(f"Total files updated: {len(all_updated_files)}")
+    logger.info(f"Completed pulling {len(config['repos'])} repositories.")
+    logger.info(f"Total files updated: {len(all_updated_files)}")
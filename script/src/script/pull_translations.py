@@ -5,96 +5,99 @@ This module handles downloading and importing translation files that already exi
 in other repositories, allowing for bulk import of translations.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import logging
+import os
 from pathlib import Path
-from typing import Dict, Any, Set, List
-from urllib.request import urlopen
-from urllib.error import URLError, HTTPError
+from typing import Any, Dict, Set, List, Tuple
 
 from .config import Config, RepoConfig
 from .pull_common import (
+    MAX_WORKERS,
     get_translations_dir,
     get_github_raw_url,
-    download_file_content,
+    get_cached_etag,
+    update_pull_index,
+    download_json_content,
+    download_modified_content,
+    load_pull_index,
+    save_pull_index,
+    prune_yaml_cache,
     process_yaml_content,
     save_yaml_file,
 )
 from .common import get_mapped_language_code
 
+logger = logging.getLogger(__name__)
 
-def get_github_api_url(owner: str, repo: str, path: str, branch: str = "master") -> str:
+
+def get_github_tree_url(owner: str, repo: str, branch: str = "master") -> str:
     """
-    Generate GitHub API URL for directory contents.
+    Generate GitHub API URL for the recursive file tree of a branch.
 
     Args:
         owner: Repository owner
         repo: Repository name
-        path: Directory path
         branch: Branch name
 
     Returns:
         str: The GitHub API URL
     """
-    return f"https://api.github.com/repos/{owner}/{repo}/contents/{path}?ref={branch}"
+    return f"https://api.github.com/repos/{owner}/{repo}/git/trees/{branch}?recursive=1"
 
 
-def download_json_content(url: str) -> Any:
+def scan_repo_tree(owner: str, repo: str, branch: str) -> List[Dict[str, Any]]:
     """
-    Download and parse JSON content from URL.
+    List all entries of a repository branch with a single API request.
 
     Args:
-        url: The URL to download from
+        owner: Repository owner
+        repo: Repository name
+        branch: Branch name
 
     Returns:
-        Any: Parsed JSON data
-
-    Raises:
-        URLError: If the download fails
+        List[Dict[str, Any]]: Tree entries with their path and type
     """
-    try:
-        import ssl
-        import json
+    data = download_json_content(get_github_tree_url(owner, repo, branch))
 
-        # Create SSL context that doesn't verify certificates
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
+    if data.get("truncated"):
+        logger.warning(f"  File tree of {owner}/{repo} is truncated, some files may be missed")
 
-        with urlopen(url, context=ssl_context) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except (URLError, HTTPError) as e:
-        raise URLError(f"Failed to download {url}: {e}")
+    return data["tree"]
 
 
-def scan_language_files(owner: str, repo: str, branch: str, lang_dir: str) -> Set[str]:
+def scan_language_files(tree: List[Dict[str, Any]], lang_dir: str) -> Set[str]:
     """
-    Scan all language files in a repository directory.
+    Find all language files directly inside a repository directory.
 
     Args:
-        owner: Repository owner
-        repo: Repository name
-        branch: Branch name
+        tree: Tree entries of the repository
         lang_dir: Language directory path
 
     Returns:
         Set[str]: Set of language file names
     """
-    try:
-        api_url = get_github_api_url(owner, repo, lang_dir, branch)
-        contents = download_json_content(api_url)
+    language_files = set()
+    for item in tree:
+        if item["type"] != "blob" or not item["path"].endswith(".yml"):
+            continue
 
-        language_files = set()
-        for item in contents:
-            if item["type"] == "file" and item["name"].endswith(".yml"):
-                language_files.add(item["name"])
+        # Plain string splitting, trees can have thousands of entries
+        parent, _, name = item["path"].rpartition("/")
+        if parent == lang_dir:
+            language_files.add(name)
 
-        return language_files
-    except Exception as e:
-        print(f"  Warning: Could not list files in {lang_dir}: {e}")
-        return set()
+    return language_files
 
 
 def pull_file(
-    owner: str, repo: str, branch: str, file_path: str, target_dir: Path, file_name: str
+    owner: str,
+    repo: str,
+    branch: str,
+    file_path: str,
+    target_dir: Path,
+    file_name: str,
+    pull_index: Dict[str, Dict[str, Any]],
 ) -> bool:
     """
     Pull a single language file.
@@ -106,97 +109,161 @@ def pull_file(
         file_path: Source file path in repository
         target_dir: Target directory
         file_name: Target file name
+        pull_index: ETags and hashes of previously downloaded files, updated in place
 
     Returns:
         bool: True if file was successfully imported
     """
     try:
         url = get_github_raw_url(owner, repo, branch, file_path)
-        content = download_file_content(url)
+        target_path = target_dir / file_name
+
+        # Download file content, unless it is unchanged since the last run
+        content, etag = download_modified_content(
+            url, get_cached_etag(pull_index, url, target_path)
+        )
+
+        if content is None:
+            logger.debug(f"    Not modified: {target_path}")
+            return False
 
         # Process YAML content with full processing pipeline
         data = process_yaml_content(content)
         if not data:
-            print(f"    Warning: No translatable content found in {file_name}")
+            logger.warning(f"    No translatable content found in {file_name}")
             return False
 
         # Save to target location (preserve quotes for imported translations)
-        target_path = target_dir / file_name
-        return save_yaml_file(data, target_path, preserve_quotes=True)
+        imported = save_yaml_file(data, target_path, preserve_quotes=True)
+        update_pull_index(pull_index, url, etag, target_path)
+        return imported
 
     except Exception as e:
-        print(f"    Error importing {file_name}: {e}")
+        logger.error(f"    Error importing {file_name}: {e}")
         return False
 
 
-def pull_repo(repo_config: RepoConfig, translations_dir: Path) -> List[str]:
+def pull_repo(
+    repo_config: RepoConfig,
+    translations_dir: Path,
+    pull_index: Dict[str, Dict[str, Any]],
+) -> List[str]:
     """
     Pull all existing translation files from a repository.
 
     Args:
         repo_config: Repository configuration
         translations_dir: Base translations directory
+        pull_index: ETags and hashes of previously downloaded files, updated in place
 
     Returns:
         List[str]: List of imported file paths
     """
-    print(
+    logger.info(
         f"Importing existing translations from: {repo_config['owner']}/{repo_config['repo']}"
     )
 
     imported_files = []
 
+    # Imported file paths are reported relative to the project root
+    relative_dir = Path(translations_dir.name) / repo_config["folder"]
+    target_dir = translations_dir / repo_config["folder"]
+
+    # Source file path of every file to import, by mapped file name, so no two
+    # workers ever write the same target file
+    downloads: Dict[str, str] = {}
+
+    # One tree listing covers every configured directory of the repository
+    tree = scan_repo_tree(repo_config["owner"], repo_config["repo"], repo_config["branch"])
+
+    # Language files by directory, for file configurations sharing a directory
+    dir_cache: Dict[str, Set[str]] = {}
+
+    # Directories and source files already handled, and source files that lost a collision
+    seen_sources: Set[Tuple[str, str]] = set()
+    skipped_paths: Set[str] = set()
+
+    # The mapping is the same for every file of the repository
+    repo_mapping = repo_config.get("language_mapping")
+
     for file_config in repo_config["files"]:
-        source_path = file_config["source"]
-        target_pattern = file_config["target"]
+        # Split the source path into its directory and the source file (en-US.yml)
+        lang_dir, _, source_file_name = file_config["source"].rpartition("/")
 
-        # Extract directory from source path
-        lang_dir = str(Path(source_path).parent)
+        # Another file configuration already imported the same language files
+        if (lang_dir, source_file_name) in seen_sources:
+            continue
+        seen_sources.add((lang_dir, source_file_name))
 
-        print(f"  Scanning directory: {lang_dir}")
+        logger.debug(f"  Scanning directory: {lang_dir}")
 
         # Get all language files in the directory
-        language_files = scan_language_files(
-            repo_config["owner"], repo_config["repo"], repo_config["branch"], lang_dir
-        )
+        if lang_dir not in dir_cache:
+            dir_cache[lang_dir] = scan_language_files(tree, lang_dir)
 
-        if not language_files:
-            print(f"    No language files found")
+        if not dir_cache[lang_dir]:
+            logger.info("    No language files found")
             continue
 
-        # Filter out the source file (en-US.yml)
-        source_file_name = Path(source_path).name
-        language_files.discard(source_file_name)
-
-        print(f"    Found {len(language_files)} translation files")
+        # Filter out the source file
+        language_files = dir_cache[lang_dir] - {source_file_name}
 
-        # Import each language file
-        target_dir = translations_dir / repo_config["folder"]
+        logger.info(f"    Found {len(language_files)} translation files")
 
-        for lang_file in language_files:
-            # Extract language code from filename
-            lang_code = Path(lang_file).stem
+        # Sorted so collisions are resolved the same way on every run
+        for lang_file in sorted(language_files):
+            # Extract language code from filename, all language files end with .yml
+            lang_code = lang_file.removesuffix(".yml")
 
-            repo_mapping = repo_config.get("language_mapping")
             mapped_lang_code = get_mapped_language_code(lang_code, repo_mapping)
             mapped_file_name = f"{mapped_lang_code}.yml"
 
             # Build source file path
-            source_file_path = f"{lang_dir}/{lang_file}"
+            source_file_path = f"{lang_dir}/{lang_file}" if lang_dir else lang_file
+
+            # Collisions are only resolved and reported once
+            if source_file_path in skipped_paths:
+                continue
+
+            existing_path = downloads.get(mapped_file_name)
+            if existing_path is None or existing_path == source_file_path:
+                downloads[mapped_file_name] = source_file_path
+                continue
+
+            # Several source files map to the same target, prefer the one already named
+            # like the target (e.g. zh-CN.yml over a mapped zh_CN.yml), otherwise the first one found
+            kept_path, skipped_path = existing_path, source_file_path
+            if (
+                lang_file == mapped_file_name
+                and existing_path.rpartition("/")[2] != mapped_file_name
+            ):
+                kept_path, skipped_path = source_file_path, existing_path
+
+            downloads[mapped_file_name] = kept_path
+            skipped_paths.add(skipped_path)
+            logger.warning(
+                f"    Both {kept_path} and {skipped_path} map to {mapped_file_name}, importing {kept_path}"
+            )
 
-            # Import the file with mapped filename
-            if pull_file(
+    # Downloads are independent, so import the files concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                pull_file,
                 repo_config["owner"],
                 repo_config["repo"],
                 repo_config["branch"],
                 source_file_path,
                 target_dir,
                 mapped_file_name,
-            ):
-                relative_path = target_dir / mapped_file_name
-                imported_files.append(
-                    str(relative_path.relative_to(translations_dir.parent))
-                )
+                pull_index,
+            ): mapped_file_name
+            for mapped_file_name, source_file_path in downloads.items()
+        }
+
+        for future in as_completed(futures):
+            if future.result():
+                imported_files.append(str(relative_dir / futures[future]))
 
     return imported_files
 
@@ -208,29 +275,36 @@ def pull_translations(config: Config) -> None:
     Args:
         config: The configuration containing all repositories
     """
+    if not os.environ.get("GITHUB_TOKEN"):
+        logger.warning(
+            "GITHUB_TOKEN is not set, GitHub API requests are limited to 60 per hour"
+        )
+
     translations_dir = get_translations_dir()
+    pull_index = load_pull_index()
     all_imported_files = []
 
     for repo_config in config["repos"]:
         try:
-            imported_files = pull_repo(repo_config, translations_dir)
+            imported_files = pull_repo(repo_config, translations_dir, pull_index)
             all_imported_files.extend(imported_files)
-            print(
+            logger.info(
                 f"  Imported {len(imported_files)} files from {repo_config['owner']}/{repo_config['repo']}:{repo_config['branch']}"
             )
         except Exception as e:
-            print(
+            logger.error(
                 f"Error processing repository {repo_config['owner']}/{repo_config['repo']}:{repo_config['branch']}: {e}"
             )
             continue
-        print()
 
-    print("=" * 60)
-    print(f"Import completed!")
-    print(f"Total repositories processed: {len(config['repos'])}")
-    print(f"Total files imported: {len(all_imported_files)}")
+    save_pull_index(pull_index)
+    prune_yaml_cache()
+
+    logger.info("Import completed!")
+    logger.info(f"Total repositories processed: {len(config['repos'])}")
+    logger.info(f"Total files imported: {len(all_imported_files)}")
 
     if all_imported_files:
-        print("\nImported files:")
+        logger.info("Imported files:")
         for file_path in all_imported_files:
-            print(f"  - {file_path}")
+            logger.info(f"  - {file_path}")
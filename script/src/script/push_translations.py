@@ -5,19 +5,19 @@ Clones each target repository, applies all translation changes in a single commi
 Skips archived repositories and empty translation files.
 """
 
-import json
+import logging
 import os
 import shutil
-import ssl
 import subprocess
 import tempfile
 from pathlib import Path
 from typing import Any
-from urllib.error import HTTPError
-from urllib.request import Request, urlopen
 
+from .common import git_commit_files
 from .config import Config, FileConfig, RepoConfig
-from .pull_common import get_translations_dir
+from .pull_common import REQUEST_TIMEOUT, get_session, get_translations_dir
+
+logger = logging.getLogger(__name__)
 
 
 def get_remote_language_code(
@@ -29,13 +29,6 @@ def get_remote_language_code(
     return language_code
 
 
-def create_ssl_context() -> ssl.SSLContext:
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    return ssl_context
-
-
 def request_github_json(
     url: str,
     token: str,
@@ -49,30 +42,18 @@ def request_github_json(
         "User-Agent": "translation-center-script",
     }
 
-    if payload is not None:
-        headers["Content-Type"] = "application/json"
-        data = json.dumps(payload).encode("utf-8")
-    else:
-        data = None
+    # The shared session verifies certificates and reuses connections
+    response = get_session().request(
+        method, url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT
+    )
 
-    request = Request(url, data=data, headers=headers, method=method)
-    ssl_context = create_ssl_context()
+    if not response.content:
+        return response.status_code, {}
 
     try:
-        with urlopen(request, context=ssl_context) as response:
-            status = response.getcode()
-            body = response.read().decode("utf-8")
-            if body:
-                return status, json.loads(body)
-            return status, {}
-    except HTTPError as e:
-        status = e.code
-        try:
-            body = e.read().decode("utf-8")
-            error_data = json.loads(body) if body else {}
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            error_data = {"message": str(e)}
-        return status, error_data
+        return response.status_code, response.json()
+    except ValueError:
+        return response.status_code, {"message": response.reason}
 
 
 def is_repo_archived(owner: str, repo: str, token: str) -> bool:
@@ -81,7 +62,7 @@ def is_repo_archived(owner: str, repo: str, token: str) -> bool:
     if status == 200:
         return bool(data.get("archived", False))
     error_msg = data.get("message", f"HTTP {status}")
-    print(f"  Warning: Failed to check repository status: {error_msg}")
+    logger.warning(f"  Failed to check repository status: {error_msg}")
     return False
 
 
@@ -132,7 +113,7 @@ def collect_changes_for_file_config(
         local_content = local_file.read_text(encoding="utf-8")
 
         if not local_content.strip():
-            print(f"  Skipping empty file: {local_file.name}")
+            logger.info(f"  Skipping empty file: {local_file.name}")
             continue
 
         local_lang_code = local_file.stem
@@ -141,8 +122,8 @@ def collect_changes_for_file_config(
         try:
             remote_path = file_config["target"].format(lang=remote_lang_code)
         except KeyError as e:
-            print(
-                f"    Error: Invalid target template for {local_file.name}: missing {e}"
+            logger.error(
+                f"    Invalid target template for {local_file.name}: missing {e}"
             )
             continue
 
@@ -156,10 +137,10 @@ def push_repo(repo_config: RepoConfig, translations_dir: Path, token: str) -> li
     repo = repo_config["repo"]
     branch = repo_config["branch"]
 
-    print(f"Processing repository: {owner}/{repo}:{branch}")
+    logger.info(f"Processing repository: {owner}/{repo}:{branch}")
 
     if is_repo_archived(owner, repo, token):
-        print(f"  Skipping archived repository: {owner}/{repo}")
+        logger.info(f"  Skipping archived repository: {owner}/{repo}")
         return []
 
     pushed_files: list[str] = []
@@ -174,14 +155,14 @@ def push_repo(repo_config: RepoConfig, translations_dir: Path, token: str) -> li
             all_changes.extend(changes)
 
         if not all_changes:
-            print("  No translation files to push")
+            logger.info("  No translation files to push")
             return pushed_files
 
-        print(f"  Found {len(all_changes)} translation files to push")
+        logger.info(f"  Found {len(all_changes)} translation files to push")
 
         repo_dir = clone_repo(owner, repo, branch, token, temp_dir)
 
-        files_changed = False
+        changed_paths: list[str] = []
         for local_file, remote_path in all_changes:
             target_path = repo_dir / remote_path
             target_path.parent.mkdir(parents=True, exist_ok=True)
@@ -193,29 +174,28 @@ def push_repo(repo_config: RepoConfig, translations_dir: Path, token: str) -> li
             new_content = local_file.read_text(encoding="utf-8")
 
             if existing_content == new_content:
-                print(f"    No changes: {remote_path}")
+                logger.debug(f"    No changes: {remote_path}")
                 continue
 
             target_path.write_text(new_content, encoding="utf-8")
-            files_changed = True
+            changed_paths.append(remote_path)
             pushed_files.append(str(local_file.relative_to(translations_dir.parent)))
-            print(f"    Updated: {remote_path}")
+            logger.info(f"    Updated: {remote_path}")
 
-        if not files_changed:
-            print("  All files are up to date")
+        if not changed_paths:
+            logger.info("  All files are up to date")
             return pushed_files
 
-        run_git_command(["add", "."], cwd=repo_dir)
-        run_git_command(["commit", "-m", "chore(i18n): update translations"], cwd=repo_dir)
+        git_commit_files("chore(i18n): update translations", changed_paths, repo_dir)
         run_git_command(["push", "origin", branch], cwd=repo_dir)
-        print(f"  Pushed {len(pushed_files)} files in a single commit")
+        logger.info(f"  Pushed {len(pushed_files)} files in a single commit")
 
     except subprocess.CalledProcessError as e:
-        print(f"  Git operation failed: {e}")
+        logger.error(f"  Git operation failed: {e}")
         if e.stderr:
-            print(f"    stderr: {e.stderr.strip()}")
+            logger.error(f"    stderr: {e.stderr.strip()}")
     except Exception as e:
-        print(f"  Error processing repository: {e}")
+        logger.error(f"  Error processing repository: {e}")
     finally:
         shutil.rmtree(temp_dir, ignore_errors=True)
 
@@ -225,8 +205,8 @@ def push_repo(repo_config: RepoConfig, translations_dir: Path, token: str) -> li
 def push_translations(config: Config) -> None:
     token = os.environ.get("BOT_TOKEN")
     if not token:
-        print("Error: BOT_TOKEN environment variable is required")
-        print(
+        logger.error("BOT_TOKEN environment variable is required")
+        logger.error(
             "Please set BOT_TOKEN with a GitHub token that has write access to target repositories"
         )
         return
@@ -234,24 +214,21 @@ def push_translations(config: Config) -> None:
     translations_dir = get_translations_dir()
     all_pushed_files: list[str] = []
 
-    print(f"Pushing translation files from: {translations_dir}")
-    print("=" * 60)
+    logger.info(f"Pushing translation files from: {translations_dir}")
 
     for repo_config in config["repos"]:
         try:
             pushed_files = push_repo(repo_config, translations_dir, token)
             all_pushed_files.extend(pushed_files)
         except Exception as e:
-            print(f"Error processing repository {repo_config['owner']}/{repo_config['repo']}: {e}")
+            logger.error(f"Error processing repository {repo_config['owner']}/{repo_config['repo']}: {e}")
             continue
-        print()
 
-    print("=" * 60)
-    print("Push completed!")
-    print(f"Total repositories processed: {len(config['repos'])}")
-    print(f"Total files pushed: {len(all_pushed_files)}")
+    logger.info("Push completed!")
+    logger.info(f"Total repositories processed: {len(config['repos'])}")
+    logger.info(f"Total files pushed: {len(all_pushed_files)}")
 
     if all_pushed_files:
-        print("\nPushed files:")
+        logger.info("Pushed files:")
         for file_path in all_pushed_files:
-            print(f"  - {file_path}")
+            logger.info(f"  - {file_path}")